@@ -14,11 +14,13 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     CITIES,
+    CONF_HIGH_RESOLUTION,
     CONF_LATITUDE,
     CONF_LOCATION,
     CONF_LOCATION_NAME,
     CONF_LONGITUDE,
     CONF_THRESHOLD,
+    DEFAULT_HIGH_RESOLUTION,
     DEFAULT_THRESHOLD,
     DOMAIN,
 )
@@ -114,6 +116,9 @@ class WillItRainConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     CONF_LONGITUDE: location_info["longitude"], 
                     CONF_LOCATION_NAME: location_info["location_name"],
                     CONF_THRESHOLD: user_input[CONF_THRESHOLD],
+                    CONF_HIGH_RESOLUTION: user_input.get(
+                        CONF_HIGH_RESOLUTION, DEFAULT_HIGH_RESOLUTION
+                    ),
                 }
 
                 return self.async_create_entry(
@@ -136,6 +141,9 @@ class WillItRainConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Required(CONF_THRESHOLD, default=DEFAULT_THRESHOLD): vol.All(
                     vol.Coerce(int), vol.Range(min=1, max=100)
                 ),
+                vol.Optional(
+                    CONF_HIGH_RESOLUTION, default=DEFAULT_HIGH_RESOLUTION
+                ): bool,
             }
         )
 
@@ -166,6 +174,9 @@ class WillItRainConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     CONF_LONGITUDE: location_info["longitude"],
                     CONF_LOCATION_NAME: location_info["location_name"],
                     CONF_THRESHOLD: user_input[CONF_THRESHOLD],
+                    CONF_HIGH_RESOLUTION: user_input.get(
+                        CONF_HIGH_RESOLUTION, DEFAULT_HIGH_RESOLUTION
+                    ),
                 }
 
                 return self.async_update_reload_and_abort(
@@ -186,6 +197,10 @@ class WillItRainConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Required(
                     CONF_THRESHOLD, default=config_entry.data.get(CONF_THRESHOLD, DEFAULT_THRESHOLD)
                 ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+                vol.Optional(
+                    CONF_HIGH_RESOLUTION,
+                    default=config_entry.data.get(CONF_HIGH_RESOLUTION, DEFAULT_HIGH_RESOLUTION),
+                ): bool,
             }
         )
 
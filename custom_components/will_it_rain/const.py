@@ -13,10 +13,12 @@ CONF_THRESHOLD: Final = "threshold"
 CONF_LATITUDE: Final = "latitude"
 CONF_LONGITUDE: Final = "longitude"
 CONF_LOCATION_NAME: Final = "location_name"
+CONF_HIGH_RESOLUTION: Final = "high_resolution"
 
 # Default values
 DEFAULT_THRESHOLD: Final = 40
 DEFAULT_LOCATION: Final = "home"
+DEFAULT_HIGH_RESOLUTION: Final = False
 
 # Scan interval
 SCAN_INTERVAL_MINUTES: Final = 10
@@ -26,6 +28,18 @@ API_URL: Final = "https://api.open-meteo.com/v1/forecast"
 # Open-Meteo doesn't require User-Agent but we'll keep it for good practice
 API_USER_AGENT: Final = "Home Assistant n0c1@github.com"
 
+# Forecast series, ordered from coarsest to finest: (API key, step in minutes)
+SERIES_HOURLY: Final = "hourly"
+SERIES_MINUTELY_15: Final = "minutely_15"
+FORECAST_SERIES: Final = [
+    (SERIES_HOURLY, 60),
+    (SERIES_MINUTELY_15, 15),
+]
+# A series resolves a time period if it has at least this many samples in it
+MIN_SAMPLES_PER_PERIOD: Final = 4
+# Open-Meteo has no precipitation probability in the 15-minute series
+MINUTELY_15_VARIABLES: Final = "precipitation"
+
 # Sensor types and time periods
 TIME_PERIODS: Final = [
     ("1h", 1, "within the next 1 hour"),
@@ -57,3 +71,4 @@ ATTR_THRESHOLD: Final = "threshold"
 ATTR_LOCATION: Final = "location"
 ATTR_NEXT_UPDATE: Final = "next_update"
 ATTR_PERIOD: Final = "period"
+ATTR_RESOLUTION: Final = "resolution"
@@ -15,11 +15,18 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, Upda
 from .const import (
     API_URL,
     API_USER_AGENT,
+    CONF_HIGH_RESOLUTION,
     CONF_LATITUDE,
     CONF_LONGITUDE,
     CONF_THRESHOLD,
+    DEFAULT_HIGH_RESOLUTION,
     DOMAIN,
+    FORECAST_SERIES,
+    MIN_SAMPLES_PER_PERIOD,
+    MINUTELY_15_VARIABLES,
     SCAN_INTERVAL_MINUTES,
+    SERIES_HOURLY,
+    SERIES_MINUTELY_15,
     TIME_PERIODS,
 )
 
@@ -35,6 +42,14 @@ class WillItRainCoordinator(DataUpdateCoordinator):
         self.latitude = entry.data[CONF_LATITUDE]
         self.longitude = entry.data[CONF_LONGITUDE]
         self.threshold = entry.data.get(CONF_THRESHOLD, 40)
+        self.high_resolution = entry.data.get(CONF_HIGH_RESOLUTION, DEFAULT_HIGH_RESOLUTION)
+        
+        # Pick the data series for each time period once, so the request only
+        # includes the 15-minute data when a period actually uses it
+        self.period_series = {
+            period_key: self._select_series(hours)
+            for period_key, hours, _ in TIME_PERIODS
+        }
         
         super().__init__(
             hass,
@@ -52,13 +67,15 @@ class WillItRainCoordinator(DataUpdateCoordinator):
             # Analyze rain probability for each time period
             rain_data = {}
             for period_key, hours, _ in TIME_PERIODS:
-                analysis = self._analyze_rain_probability(weather_data, hours)
+                series = self.period_series[period_key]
+                analysis = self._analyze_rain_probability(weather_data, hours, series)
                 rain_data[period_key] = {
                     "probability": analysis["probability"],
                     "precipitation_amount": analysis["precipitation_amount"],
                     "will_rain": analysis["probability"] >= self.threshold,
                     "threshold": self.threshold,
                     "hours": hours,
+                    "resolution": analysis["resolution"],
                 }
             
             return rain_data
@@ -76,6 +93,17 @@ class WillItRainCoordinator(DataUpdateCoordinator):
             "forecast_days": 2,  # Get 2 days worth of data for 24h forecasts
         }
         
+        # Only request 15-minute data for the periods that need it
+        minutely_hours = [
+            hours
+            for period_key, hours, _ in TIME_PERIODS
+            if self.period_series[period_key] == SERIES_MINUTELY_15
+        ]
+        if minutely_hours:
+            params[SERIES_MINUTELY_15] = MINUTELY_15_VARIABLES
+            # One extra step covers the partially elapsed current quarter hour
+            params["forecast_minutely_15"] = max(minutely_hours) * 4 + 1
+        
         headers = {
             "User-Agent": API_USER_AGENT,
             "Accept": "application/json",
@@ -93,24 +121,76 @@ class WillItRainCoordinator(DataUpdateCoordinator):
             response.raise_for_status()
             return await response.json()
 
-    def _analyze_rain_probability(self, data: dict[str, Any], hours: int) -> dict[str, Any]:
+    def _select_series(self, hours: int) -> str:
+        """Return the coarsest enabled data series that still resolves a time period."""
+        finest = SERIES_HOURLY
+        for series_key, step_minutes in FORECAST_SERIES:
+            if series_key == SERIES_MINUTELY_15 and not self.high_resolution:
+                continue
+            if hours * 60 // step_minutes >= MIN_SAMPLES_PER_PERIOD:
+                return series_key
+            finest = series_key
+        # No series has enough samples, use the finest one available
+        return finest
+
+    def _analyze_rain_probability(
+        self, data: dict[str, Any], hours: int, series: str = SERIES_HOURLY
+    ) -> dict[str, Any]:
         """Analyze rain probability for a specific time period using Open-Meteo data."""
         now = datetime.now()
         target_time = now + timedelta(hours=hours)
         
-        max_probability = 0
-        total_precipitation = 0.0
-        data_points = 0
+        # Fall back to hourly data if the requested series is missing,
+        # e.g. when the API returned no 15-minute data for this location
+        if not data.get(series, {}).get("time"):
+            series = SERIES_HOURLY
         
-        # Open-Meteo returns data in hourly arrays
-        hourly_data = data.get("hourly", {})
-        times = hourly_data.get("time", [])
-        probabilities = hourly_data.get("precipitation_probability", [])
-        precipitations = hourly_data.get("precipitation", [])
+        # The 15-minute series has no precipitation probability, so that
+        # value always comes from the hourly data
+        probabilities = self._window_values(
+            data, self._series_with(data, series, "precipitation_probability"),
+            "precipitation_probability", now, target_time,
+        )
+        precipitations = self._window_values(
+            data, series, "precipitation", now, target_time
+        )
+        
+        max_probability = max(probabilities, default=0)
+        total_precipitation = float(sum(precipitations))
         
-        _LOGGER.debug("Processing %d hourly data points for %d hour forecast", len(times), hours)
+        _LOGGER.debug("Analysis for %dh (%s): max_prob=%d%%, total_precip=%.2fmm, data_points=%d", 
+                     hours, series, max_probability, total_precipitation, len(precipitations))
         
-        # Process each hourly entry within our time window
+        return {
+            "probability": max_probability,
+            "precipitation_amount": total_precipitation,
+            "resolution": series,
+        }
+
+    @staticmethod
+    def _series_with(data: dict[str, Any], series: str, variable: str) -> str:
+        """Return the series if it contains the variable, otherwise hourly."""
+        if variable in data.get(series, {}):
+            return series
+        return SERIES_HOURLY
+
+    @staticmethod
+    def _window_values(
+        data: dict[str, Any],
+        series: str,
+        variable: str,
+        now: datetime,
+        target_time: datetime,
+    ) -> list[float]:
+        """Return the values of a variable within the forecast window."""
+        # Open-Meteo returns each series as parallel arrays
+        series_data = data.get(series, {})
+        times = series_data.get("time", [])
+        values = series_data.get(variable, [])
+        
+        _LOGGER.debug("Processing %d %s data points for %s", len(times), series, variable)
+        
+        window_values = []
         for i, time_str in enumerate(times):
             # Parse time (Open-Meteo format: "2024-01-15T14:00")
             try:
@@ -121,26 +201,11 @@ class WillItRainCoordinator(DataUpdateCoordinator):
                 
                 # Check if this time point is within our forecast window
                 if now <= entry_time <= target_time:
-                    # Get precipitation probability (0-100%)
-                    if i < len(probabilities) and probabilities[i] is not None:
-                        prob = probabilities[i]
-                        max_probability = max(max_probability, prob)
-                        _LOGGER.debug("Time %s: probability %d%%", time_str, prob)
-                    
-                    # Get precipitation amount (mm)
-                    if i < len(precipitations) and precipitations[i] is not None:
-                        amount = precipitations[i]
-                        total_precipitation += amount
-                        data_points += 1
+                    if i < len(values) and values[i] is not None:
+                        window_values.append(values[i])
                         
             except (ValueError, TypeError) as err:
                 _LOGGER.warning("Error parsing time %s: %s", time_str, err)
                 continue
         
-        _LOGGER.debug("Analysis for %dh: max_prob=%d%%, total_precip=%.2fmm, data_points=%d", 
-                     hours, max_probability, total_precipitation, data_points)
-        
-        return {
-            "probability": max_probability,
-            "precipitation_amount": total_precipitation,
-        }
+        return window_values
@@ -23,9 +23,11 @@ from .const import (
     ATTR_PERIOD,
     ATTR_PRECIPITATION_AMOUNT,
     ATTR_PROBABILITY,
+    ATTR_RESOLUTION,
     ATTR_THRESHOLD,
     CONF_LOCATION_NAME,
     DOMAIN,
+    FORECAST_SERIES,
     TIME_PERIODS,
 )
 from .coordinator import WillItRainCoordinator
@@ -184,6 +186,10 @@ class WillItRainSensor(CoordinatorEntity[WillItRainCoordinator], SensorEntity):
             ATTR_LOCATION: self.coordinator.entry.data[CONF_LOCATION_NAME],
         }
         
+        step_minutes = dict(FORECAST_SERIES).get(period_data.get("resolution"))
+        if step_minutes:
+            base_attrs[ATTR_RESOLUTION] = f"{step_minutes} minutes"
+        
         if self._sensor_type == "rain":
             base_attrs.update({
                 ATTR_THRESHOLD: f"{period_data['threshold']}%",